@@ -0,0 +1,207 @@
+import time
+from functools import wraps
+
+class FuzzyProfiler:
+    """
+    Collects hot-path timings for an InferenceEngine.
+    Time and call counts are attributed to nested frames (rule evaluations,
+    membership computations, aggregation, defuzzification), and rule
+    check/evaluate/fire counts are tracked across a whole workload.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        """Discards every collected measurement but keeps registered rules and outputs."""
+        self.stack = []
+        # {(frame, frame, ...): [calls, total_seconds, self_seconds]}
+        self.stack_stats = {}
+        self.inference_runs = 0
+
+        # Keep the registrations, only zero the counters
+        rules = getattr(self, "rule_stats", {})
+        self.rule_stats = {key: {"logic": stats["logic"], "checked": 0, "evaluated": 0, "fired": 0}
+                           for key, stats in rules.items()}
+        self.output_ranges = getattr(self, "output_ranges", {})
+
+    # ---------------------------------------------------------------- frames
+
+    def enter(self, frame):
+        # [frame name, start time, time spent in child frames]
+        self.stack.append([frame, self.clock(), 0.0])
+
+    def exit(self):
+        frame, start, child_time = self.stack[-1]
+        elapsed = self.clock() - start
+        path = tuple(entry[0] for entry in self.stack)
+        self.stack.pop()
+
+        stats = self.stack_stats.setdefault(path, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] += elapsed - child_time
+
+        # Report the elapsed time to the parent so its self time excludes it
+        if self.stack:
+            self.stack[-1][2] += elapsed
+
+    def section(self, frame):
+        """Returns a context manager timing the enclosed block as 'frame'."""
+        return _ProfiledSection(self, frame)
+
+    def instrument_method(self, obj, method_name, frame):
+        """
+        Shadows a bound method on a single instance with a timed wrapper.
+        Used for methods that are called from inside other classes
+        (e.g. compute_membership called by aggregate_outputs).
+        """
+        method = getattr(obj, method_name)
+
+        @wraps(method)
+        def _timed(*args, **kwargs):
+            self.enter(frame)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.exit()
+
+        setattr(obj, method_name, _timed)
+
+    @staticmethod
+    def uninstrument_method(obj, method_name):
+        """Removes a wrapper installed by instrument_method, restoring the class method."""
+        if method_name in vars(obj):
+            delattr(obj, method_name)
+
+    # ---------------------------------------------------------------- counters
+
+    def register_rule(self, rule_type, rule_index, logic):
+        self.rule_stats.setdefault((rule_type, rule_index),
+                                   {"logic": logic, "checked": 0, "evaluated": 0, "fired": 0})
+
+    def register_output_variable(self, var_name, x_range):
+        self.output_ranges[var_name] = x_range
+
+    def count_inference_run(self):
+        self.inference_runs += 1
+
+    def count_rule_check(self, rule_type, rule_index):
+        """A rule was considered (its applicability was checked)."""
+        self.rule_stats[(rule_type, rule_index)]["checked"] += 1
+
+    def count_rule_evaluation(self, rule_type, rule_index, fired):
+        """A rule was evaluated; 'fired' is True if its strength was above zero."""
+        stats = self.rule_stats[(rule_type, rule_index)]
+        stats["evaluated"] += 1
+        if fired:
+            stats["fired"] += 1
+
+    # ---------------------------------------------------------------- results
+
+    def get_frame_stats(self):
+        """
+        Aggregates the per-stack measurements by frame name.
+        Returns a list of (frame, calls, total_seconds, self_seconds),
+        sorted by total time (most expensive first).
+        """
+        frames = {}
+        for path, (calls, total, self_time) in self.stack_stats.items():
+            stats = frames.setdefault(path[-1], [0, 0.0, 0.0])
+            stats[0] += calls
+            # A frame never nests inside itself here, so totals can be summed safely
+            stats[1] += total
+            stats[2] += self_time
+
+        frame_stats = [(frame, *stats) for frame, stats in frames.items()]
+        frame_stats.sort(reverse=True, key=lambda entry: entry[2])
+        return frame_stats
+
+    def get_rule_stats(self):
+        """Returns rule counters sorted by fire count (least fired first)."""
+        rule_stats = [
+            {"rule_type": rule_type, "rule_index": rule_index, **stats}
+            for (rule_type, rule_index), stats in self.rule_stats.items()
+        ]
+        rule_stats.sort(key=lambda entry: (entry["fired"], entry["rule_type"], entry["rule_index"]))
+        return rule_stats
+
+    def get_never_fired_rules(self):
+        """Rules that were checked at least once but never fired: candidates for pruning."""
+        return [entry for entry in self.get_rule_stats() if entry["checked"] > 0 and entry["fired"] == 0]
+
+    def get_report(self):
+        """Builds a human-readable report of the collected measurements."""
+        lines = [f"Inference runs: {self.inference_runs}", ""]
+
+        lines.append("Frames (sorted by total time):")
+        lines.append(f"  {'calls':>9} {'total ms':>11} {'self ms':>11} {'avg us':>10}  frame")
+        for frame, calls, total, self_time in self.get_frame_stats():
+            lines.append(f"  {calls:>9} {total * 1e3:>11.3f} {self_time * 1e3:>11.3f} "
+                         f"{total / calls * 1e6:>10.2f}  {frame}")
+
+        lines.append("")
+        lines.append("Rules (sorted by fire count):")
+        lines.append(f"  {'checked':>8} {'evaluated':>9} {'fired':>8} {'fire %':>7}  rule")
+        for entry in self.get_rule_stats():
+            fire_rate = 100 * entry["fired"] / entry["checked"] if entry["checked"] else 0
+            lines.append(f"  {entry['checked']:>8} {entry['evaluated']:>9} {entry['fired']:>8} {fire_rate:>7.1f}  "
+                         f"{entry['rule_type']}[{entry['rule_index']}] {entry['logic']}")
+
+        never_fired = self.get_never_fired_rules()
+        if never_fired:
+            lines.append("")
+            lines.append("Rules that never fired:")
+            for entry in never_fired:
+                lines.append(f"  {entry['rule_type']}[{entry['rule_index']}] {entry['logic']}")
+
+        # Aggregation walks every point of the output range, so show the cost against the width
+        frame_stats = {frame: (calls, total) for frame, calls, total, _ in self.get_frame_stats()}
+        output_lines = []
+        for var_name, x_range in self.output_ranges.items():
+            calls, total = frame_stats.get("aggregate_outputs:" + var_name, (0, 0.0))
+            if not calls:
+                continue
+            width = x_range[1] - x_range[0] + 1
+            output_lines.append((total, f"  {width:>8} {calls:>9} {total * 1e3:>11.3f} "
+                                        f"{total / (calls * width) * 1e9:>12.1f}  {var_name}"))
+        if output_lines:
+            output_lines.sort(reverse=True, key=lambda entry: entry[0])
+            lines.append("")
+            lines.append("Output aggregation (sorted by total time):")
+            lines.append(f"  {'points':>8} {'calls':>9} {'total ms':>11} {'ns / point':>12}  output")
+            lines.extend(line for _, line in output_lines)
+
+        return "\n".join(lines)
+
+    def get_collapsed_stacks(self):
+        """
+        Returns the measurements in the collapsed-stack format read by flamegraph tools:
+        one 'frame;frame;frame <self time in microseconds>' line per stack.
+        """
+        lines = []
+        for path, (_, _, self_time) in sorted(self.stack_stats.items()):
+            microseconds = round(self_time * 1e6)
+            if microseconds > 0:
+                lines.append(f"{';'.join(path)} {microseconds}")
+        return "\n".join(lines) + "\n"
+
+    def write_collapsed_stacks(self, file_path):
+        with open(file_path, "w") as f:
+            f.write(self.get_collapsed_stacks())
+
+
+class _ProfiledSection:
+    """Context manager used by FuzzyProfiler.section()."""
+
+    def __init__(self, profiler, frame):
+        self.profiler = profiler
+        self.frame = frame
+
+    def __enter__(self):
+        self.profiler.enter(self.frame)
+
+    def __exit__(self, *exc_info):
+        self.profiler.exit()
+        return False
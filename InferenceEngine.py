@@ -1,13 +1,18 @@
+from contextlib import nullcontext
 from FuzzyInputVariable import FuzzyInputVariable
+from FuzzyProfiler import FuzzyProfiler
 from FuzzyJsonParserFunctions import parse_input_vars, parse_output_vars, parse_rules, sort_rule_types_by_priority_util, sort_output_vars_by_rule_types_util
 
+# Shared no-op section used when profiling is disabled
+_NOT_PROFILED = nullcontext()
+
 class InferenceEngine:
     """
     The core engine that orchestrates the fuzzy inference process.
     It manages inputs, outputs, rules, and the execution flow (fuzzification -> inference -> defuzzification).
     """
 
-    def __init__(self, json_dict):
+    def __init__(self, json_dict, profile=False):
         self.input_vars = parse_input_vars(json_dict)
         self.output_vars = parse_output_vars(json_dict)
         self.rules = parse_rules(json_dict)
@@ -24,12 +29,24 @@ class InferenceEngine:
         self.ordered_rule_type_names = sort_rule_types_by_priority_util(json_dict, self.rules)
         self.ordered_output_var_names = sort_output_vars_by_rule_types_util(json_dict, self.ordered_rule_type_names)
 
+        # Opt-in hot-path profiling (see enable_profiling)
+        self.profiler = None
+        if profile:
+            self.enable_profiling()
+
     def __call__(self, args_dict):
         """
         Main execution method. 
         Args:
             args_dict: A dictionary containing crisp input values {var_name: value}
         """
+        if self.profiler is not None:
+            self.profiler.count_inference_run()
+
+        with self._profile("inference"):
+            return self._infer(args_dict)
+
+    def _infer(self, args_dict):
         result_dict = {}
 
         # 1. Reset state from previous runs
@@ -46,24 +63,26 @@ class InferenceEngine:
             if var_arg is None:
                 continue
             
-            var.fuzzify(var_arg)
+            with self._profile("fuzzify:" + var_name):
+                var.fuzzify(var_arg)
 
         # 3. Process rules in the defined order (Sequential Inference)
         # This loop handles the cascading logic: Output of Step N -> Input of Step N+1
         for rule_type, out_var_name in zip(self.ordered_rule_type_names, self.ordered_output_var_names):
             
-            applicable_rules = self.get_applicable_rules_by_priority(rule_type)
-            
-            if applicable_rules:
-                # Calculate rule strengths and apply clipping (Implication)
-                fired_rules = self.apply_rules(rule_type, applicable_rules)
-                self.execution_trace.extend(fired_rules)
+            with self._profile(rule_type):
+                applicable_rules = self.get_applicable_rules_by_priority(rule_type)
                 
-                # Combine results and convert back to a crisp number (Aggregation & Defuzzification)
-                # 'derive=True' ensures this result is fed back as an input for the next loop iteration
-                crisp_result = self.aggregate_and_defuzzify(out_var_name, derive=True)
-            else:
-                crisp_result = None
+                if applicable_rules:
+                    # Calculate rule strengths and apply clipping (Implication)
+                    fired_rules = self.apply_rules(rule_type, applicable_rules)
+                    self.execution_trace.extend(fired_rules)
+                    
+                    # Combine results and convert back to a crisp number (Aggregation & Defuzzification)
+                    # 'derive=True' ensures this result is fed back as an input for the next loop iteration
+                    crisp_result = self.aggregate_and_defuzzify(out_var_name, derive=True)
+                else:
+                    crisp_result = None
             
             result_dict[out_var_name] = crisp_result
             
@@ -77,6 +96,11 @@ class InferenceEngine:
             rule_index for rule_index in range(len(self.rules[rule_type])) 
             if self.rules[rule_type][rule_index].is_applicable()
         ]
+
+        if self.profiler is not None:
+            for rule_index in range(len(self.rules[rule_type])):
+                self.profiler.count_rule_check(rule_type, rule_index)
+
         # Sort rules: Higher priority rules first
         applicable_rules.sort(reverse=True, key=lambda name: self.rules[rule_type][name].get_priority())
         return applicable_rules
@@ -91,7 +115,11 @@ class InferenceEngine:
             rule = self.rules[rule_type][rule_index]
             
             # rule() calls the __call__ method of FuzzyRule to get min_eval (strength)
-            clip_level = rule()
+            with self._profile(f"rule:{rule_type}[{rule_index}]"):
+                clip_level = rule()
+            
+            if self.profiler is not None:
+                self.profiler.count_rule_evaluation(rule_type, rule_index, clip_level > 0)
             
             if clip_level > 0:
                 out_var_name, out_agg_name = rule.get_aggregation_information()
@@ -116,10 +144,12 @@ class InferenceEngine:
         var = self.output_vars[output_var_name]
         
         # Merge all clipped sets into one shape
-        var.aggregate_outputs()
+        with self._profile("aggregate_outputs:" + output_var_name):
+            var.aggregate_outputs()
         
         # Calculate crisp value (Center of Gravity)
-        crisp_result = var.defuzzify()
+        with self._profile("defuzzify:" + output_var_name):
+            crisp_result = var.defuzzify()
         
         # Feedback loop logic:
         # If this output is needed for a future rule, create a "computed" input variable for it.
@@ -137,7 +167,8 @@ class InferenceEngine:
             
             # Immediately fuzzify the result so it's ready for the next iteration in __call__
             if crisp_result is not None:
-                derived_variable.fuzzify(crisp_result)
+                with self._profile("fuzzify:" + derived_variable.get_name()):
+                    derived_variable.fuzzify(crisp_result)
                 
         return crisp_result
 
@@ -154,4 +185,49 @@ class InferenceEngine:
 
     def get_execution_trace(self):
         return self.execution_trace
-    
\ No newline at end of file
+
+    def enable_profiling(self):
+        """
+        Turns on hot-path profiling and returns the FuzzyProfiler collecting the data.
+        Time and call counts are attributed to each rule evaluation, each variable's
+        compute_membership, and each output's aggregate_outputs/defuzzify.
+        """
+        if self.profiler is not None:
+            return self.profiler
+
+        self.profiler = FuzzyProfiler()
+
+        # compute_membership is called from inside the variables (fuzzify, aggregate_outputs),
+        # so it is timed by wrapping it on each instance.
+        for var in list(self.input_vars.values()) + list(self.output_vars.values()):
+            self.profiler.instrument_method(var, "compute_membership", "compute_membership:" + var.get_name())
+
+        for var_name, var in self.output_vars.items():
+            self.profiler.register_output_variable(var_name, var.get_range())
+
+        for rule_type, rules in self.rules.items():
+            for rule_index, rule in enumerate(rules):
+                self.profiler.register_rule(rule_type, rule_index, str(rule))
+
+        return self.profiler
+
+    def disable_profiling(self):
+        """Turns off profiling and removes the instrumentation. Returns the last profiler, if any."""
+        profiler = self.profiler
+        if profiler is None:
+            return None
+
+        for var in list(self.input_vars.values()) + list(self.output_vars.values()):
+            FuzzyProfiler.uninstrument_method(var, "compute_membership")
+
+        self.profiler = None
+        return profiler
+
+    def get_profiler(self):
+        return self.profiler
+
+    def _profile(self, frame):
+        """Times the enclosed block as 'frame' when profiling is enabled, otherwise does nothing."""
+        if self.profiler is None:
+            return _NOT_PROFILED
+        return self.profiler.section(frame)